@@ -3,16 +3,18 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from .config import get_settings
 from .routers import actions, health, meta, permissions
 from .security import API_KEY_HEADER, API_KEY_HEADER_NAME
 from .utils.logging import configure_logging
+from .utils.paginate import CursorError
 from .utils.swagger2 import SwaggerConversionError, convert_openapi3_to_swagger2
 
 load_dotenv()
@@ -46,6 +48,11 @@ app.include_router(actions.router)
 app.include_router(permissions.router)
 
 
+@app.exception_handler(CursorError)
+async def _invalid_cursor(request: Request, exc: CursorError) -> ORJSONResponse:
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+
 def custom_openapi() -> Dict[str, Any]:
     if app.openapi_schema:
         return app.openapi_schema
@@ -70,24 +77,27 @@ def custom_openapi() -> Dict[str, Any]:
 app.openapi = custom_openapi  # type: ignore[assignment]
 
 
+def _cache_swagger2() -> bytes:
+    """Convert the OpenAPI schema once and keep the serialized Swagger 2.0 body on app state."""
+
+    app.state.swagger2_bytes = orjson.dumps(convert_openapi3_to_swagger2(app.openapi()))
+    return app.state.swagger2_bytes
+
+
 @app.on_event("startup")
 async def _build_swagger2() -> None:
     try:
-        openapi = app.openapi()
-        swagger2 = convert_openapi3_to_swagger2(openapi)
-        app.state.swagger2 = swagger2
+        _cache_swagger2()
     except SwaggerConversionError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @app.get("/swagger2.json", include_in_schema=False)
-def get_swagger2() -> Dict[str, Any]:
-    swagger2 = getattr(app.state, "swagger2", None)
-    if swagger2 is None:
-        openapi = app.openapi()
-        swagger2 = convert_openapi3_to_swagger2(openapi)
-        app.state.swagger2 = swagger2
-    return swagger2
+def get_swagger2() -> Response:
+    body = getattr(app.state, "swagger2_bytes", None)
+    if body is None:
+        body = _cache_swagger2()
+    return Response(content=body, media_type="application/json")
 
 
 __all__ = ["app"]
@@ -10,6 +10,15 @@ from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _strip_quotes(path_str: str) -> str:
+    """Remove whitespace and one pair of matching surrounding quotes (common in .env files)."""
+
+    path_str = path_str.strip()
+    if len(path_str) >= 2 and path_str[0] == path_str[-1] and path_str[0] in {'"', "'"}:
+        return path_str[1:-1].strip()
+    return path_str
+
+
 class Settings(BaseSettings):
     """Runtime configuration loaded from environment variables."""
 
@@ -37,6 +46,8 @@ class Settings(BaseSettings):
 
     @field_validator("onedrive_local_path", mode="before")
     def _expand_local_path(cls, value: Optional[str | Path]) -> Optional[Path]:
+        if isinstance(value, str):
+            value = _strip_quotes(value)
         if value in (None, ""):
             return None
         return Path(value).expanduser().resolve()
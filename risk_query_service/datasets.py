@@ -1,8 +1,11 @@
 """Dataset access utilities built on Polars lazy execution."""
 from __future__ import annotations
 
+import functools
 import hashlib
+import io
 import itertools
+import operator
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -14,7 +17,20 @@ from .file_index import FileRecord, ReportType, get_latest_file_with_hash
 from .utils.schema import CANONICAL_COLUMNS, CANONICAL_TYPES, DEFAULT_COLUMNS, canonicalize_columns
 
 
-@dataclass
+DERIVED_COLUMNS = {"IsCritical", "ReportType"}
+ACTION_REPORT_TYPES = frozenset({"actions", "crit_actions"})
+PERMISSION_REPORT_TYPES = frozenset({"perms", "crit_perms"})
+SEARCH_COLUMNS = ("User ID", "User Name", "Role ID", "Risk Level", "System", "Action")
+LAST_EXECUTED_DATE = "_last_executed_date"
+
+
+def search_column(name: str) -> str:
+    """Name of the hidden lower-cased copy of ``name`` used for case-insensitive filters."""
+
+    return f"_{name}_lc"
+
+
+@dataclass(frozen=True)
 class DatasetBundle:
     lazyframe: pl.LazyFrame
     file_hash: str
@@ -22,69 +38,90 @@ class DatasetBundle:
 
 
 def scan_report(path: Path) -> pl.LazyFrame:
-    """Scan a TSV report lazily."""
+    """Scan a TSV report lazily.
+
+    Every source column is text in ``CANONICAL_TYPES``, so type inference is disabled to
+    keep identifiers such as ``007`` intact instead of parsing them as integers.
+    """
 
     return pl.scan_csv(
         path,
         separator="\t",
         has_header=True,
         ignore_errors=True,
-        infer_schema_length=100,
+        infer_schema_length=0,
     )
 
 
 def _normalize_lazyframe(lf: pl.LazyFrame, report_type: ReportType, file_path: Path) -> pl.LazyFrame:
-    columns = lf.columns
-    missing = [name for name in CANONICAL_COLUMNS if name not in columns]
-    for name in missing:
-        if name == "IsCritical":
-            lf = lf.with_columns(pl.lit(False).alias("IsCritical"))
-        else:
-            lf = lf.with_columns(pl.lit(None).cast(CANONICAL_TYPES[name]).alias(name))
-
-    if "IsCritical" in columns:
-        lf = lf.with_columns(pl.col("IsCritical").cast(pl.Boolean))
-
     is_critical = "crit" in file_path.stem.lower()
-    lf = lf.with_columns(
-        pl.lit(is_critical).alias("IsCritical"),
-        pl.lit(_report_type_label(report_type, is_critical)).alias("ReportType"),
-    )
-    return lf.select(CANONICAL_COLUMNS)
-
-
+    schema = lf.schema
+    # IsCritical and ReportType are derived from the file itself, so any source values are
+    # replaced outright. Source columns are scanned as text, which every other canonical
+    # type already is, so only missing columns need a typed null here.
+    exprs: List[pl.Expr] = []
+    for name in CANONICAL_COLUMNS:
+        if name in DERIVED_COLUMNS:
+            continue
+        if name not in schema:
+            exprs.append(pl.lit(None).cast(CANONICAL_TYPES[name]).alias(name))
+    exprs.append(pl.lit(is_critical).alias("IsCritical"))
+    exprs.append(pl.lit(_report_type_label(report_type, is_critical)).alias("ReportType"))
+    lf = lf.with_columns(exprs).select(CANONICAL_COLUMNS)
+    # Unused helper columns are dropped again by projection pushdown.
+    helpers = [pl.col(name).str.to_lowercase().alias(search_column(name)) for name in SEARCH_COLUMNS]
+    helpers.append(pl.col("Last Executed On").str.strptime(pl.Date, strict=False, format=None).alias(LAST_EXECUTED_DATE))
+    return lf.with_columns(helpers)
+
+
+@functools.lru_cache(maxsize=None)
 def _report_type_label(report_type: ReportType, is_critical: bool) -> str:
-    if report_type in {"actions", "crit_actions"}:
+    if report_type in ACTION_REPORT_TYPES:
         return "Critical Action" if is_critical else "Action"
-    if report_type in {"perms", "crit_perms"}:
+    if report_type in PERMISSION_REPORT_TYPES:
         return "Critical Permission" if is_critical else "Permission"
     return report_type
 
 
-def _load_bundle(report_type: ReportType) -> Tuple[pl.LazyFrame, FileRecord]:
-    record = get_latest_file_with_hash(report_type)
+@functools.lru_cache(maxsize=8)
+def _scan_normalized(record: FileRecord) -> pl.LazyFrame:
+    """Build the normalized plan for a file once per record (records change with the file hash)."""
+
     lf = scan_report(record.path)
-    lf = _normalize_lazyframe(lf, report_type, record.path)
-    return lf, record
+    return _normalize_lazyframe(lf, record.report_type, record.path)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_bundle(records: Tuple[FileRecord, ...]) -> DatasetBundle:
+    """Combine the given files into one bundle; cached per set of file versions."""
+
+    frames = [_scan_normalized(record) for record in records]
+    digest = hashlib.sha1()
+    for index, record in enumerate(records):
+        if index:
+            digest.update(b"|")
+        digest.update(record.file_hash.encode("utf-8"))
+    lazyframe = pl.concat(frames, how="vertical_relaxed", rechunk=False) if len(frames) > 1 else frames[0]
+    canonical_report = records[0].report_type
+    report_label = "actions" if canonical_report in ACTION_REPORT_TYPES else "permissions"
+    return DatasetBundle(lazyframe=lazyframe, file_hash=digest.hexdigest(), report_type=report_label)
 
 
 def _combine_frames(report_types: Iterable[ReportType]) -> DatasetBundle:
-    frames: List[pl.LazyFrame] = []
-    hashes: List[str] = []
-    canonical_report: Optional[str] = None
-    for report_type in report_types:
-        lf, record = _load_bundle(report_type)
-        frames.append(lf)
-        hashes.append(record.file_hash)
-        canonical_report = canonical_report or report_type
-    lazyframe = pl.concat(frames, how="vertical") if len(frames) > 1 else frames[0]
-    combined_hash = hashlib.sha1("|".join(hashes).encode("utf-8")).hexdigest()
-    report_label = "actions" if canonical_report in {"actions", "crit_actions"} else "permissions"
-    return DatasetBundle(lazyframe=lazyframe, file_hash=combined_hash, report_type=report_label)
+    records = tuple(get_latest_file_with_hash(report_type) for report_type in report_types)
+    return _build_bundle(records)
+
 
+def actions_bundle() -> DatasetBundle:
+    """Return the combined regular and critical action reports."""
 
-actions_bundle = lambda: _combine_frames(["actions", "crit_actions"])  # noqa: E731
-permissions_bundle = lambda: _combine_frames(["perms", "crit_perms"])  # noqa: E731
+    return _combine_frames(("actions", "crit_actions"))
+
+
+def permissions_bundle() -> DatasetBundle:
+    """Return the combined regular and critical permission reports."""
+
+    return _combine_frames(("perms", "crit_perms"))
 
 
 FILTERABLE_COLUMNS = {
@@ -113,38 +150,40 @@ def apply_filters(
         term = user.lower()
         exprs.append(
             pl.any_horizontal(
-                [pl.col(col).cast(pl.Utf8).str.to_lowercase().str.contains(term) for col in FILTERABLE_COLUMNS["user"]]
+                [pl.col(search_column(col)).str.contains(term, literal=True) for col in FILTERABLE_COLUMNS["user"]]
             )
         )
     if role:
-        exprs.append(pl.col("Role ID").cast(pl.Utf8).str.to_lowercase() == role.lower())
+        exprs.append(pl.col(search_column("Role ID")) == role.lower())
     if risk_level:
-        exprs.append(pl.col("Risk Level").cast(pl.Utf8).str.to_lowercase() == risk_level.lower())
+        exprs.append(pl.col(search_column("Risk Level")) == risk_level.lower())
     if system:
-        exprs.append(pl.col("System").cast(pl.Utf8).str.to_lowercase() == system.lower())
+        exprs.append(pl.col(search_column("System")) == system.lower())
     if action:
-        exprs.append(pl.col("Action").cast(pl.Utf8).str.to_lowercase() == action.lower())
+        exprs.append(pl.col(search_column("Action")) == action.lower())
 
-    if date_from or date_to:
-        parsed = pl.col("Last Executed On").str.strptime(pl.Date, strict=False, format=None)
-        if date_from:
-            exprs.append(parsed >= pl.lit(date_from))
-        if date_to:
-            exprs.append(parsed <= pl.lit(date_to))
+    if date_from:
+        exprs.append(pl.col(LAST_EXECUTED_DATE) >= pl.lit(date_from))
+    if date_to:
+        exprs.append(pl.col(LAST_EXECUTED_DATE) <= pl.lit(date_to))
 
-    for expr in exprs:
-        lf = lf.filter(expr)
+    if exprs:
+        lf = lf.filter(functools.reduce(operator.and_, exprs))
     return lf
 
 
-def paginate_collect(lf: pl.LazyFrame, limit: int, offset: int) -> Tuple[List[Dict[str, object]], bool]:
-    window = lf.slice(offset, limit + 1)
-    result = window.collect()
-    rows = result.to_dicts()
-    has_more = len(rows) > limit
-    if has_more:
-        rows = rows[:limit]
-    return rows, has_more
+def paginate_collect(lf: pl.LazyFrame, limit: int, offset: int) -> Tuple[bytes, int, bool]:
+    """Collect one page and serialize it straight to a JSON array of row objects.
+
+    Returns the JSON bytes, the number of rows in the page and whether more rows follow.
+    """
+
+    result = lf.slice(offset, limit + 1).collect()
+    has_more = result.height > limit
+    page = result.head(limit)
+    buffer = io.BytesIO()
+    page.write_json(buffer, row_oriented=True)
+    return buffer.getvalue(), page.height, has_more
 
 
 def select_columns(lf: pl.LazyFrame, columns: Optional[List[str]]) -> pl.LazyFrame:
@@ -155,7 +194,9 @@ def select_columns(lf: pl.LazyFrame, columns: Optional[List[str]]) -> pl.LazyFra
     return lf.select(resolved)
 
 
-def summarize(lf: pl.LazyFrame, groupby: str, top: int) -> List[Dict[str, object]]:
+def summarize(lf: pl.LazyFrame, groupby: str, top: int) -> Tuple[bytes, int]:
+    """Return the top groups serialized as a JSON array, plus the number of groups."""
+
     summary = (
         lf.group_by(groupby)
         .agg(
@@ -168,12 +209,11 @@ def summarize(lf: pl.LazyFrame, groupby: str, top: int) -> List[Dict[str, object
         .limit(top)
         .collect()
     )
-    records = []
-    for row in summary.iter_rows(named=True):
-        records.append({"group": row[groupby], "count": row["count"], "examples": row["examples"]})
-    return records
+    buffer = io.BytesIO()
+    summary.rename({groupby: "group"}).select(["group", "count", "examples"]).write_json(buffer, row_oriented=True)
+    return buffer.getvalue(), summary.height
 
 
 def infer_schema(lf: pl.LazyFrame) -> Dict[str, str]:
     schema = lf.schema
-    return {name: dtype.__class__.__name__ for name, dtype in schema.items()}
+    return {name: dtype.__class__.__name__ for name, dtype in schema.items() if name in CANONICAL_COLUMNS}
@@ -1,16 +1,19 @@
 """File discovery and indexing for report selection."""
 from __future__ import annotations
 
+import os
 import re
+import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Literal, Optional, Tuple
 
 from cachetools import TTLCache
 
 from .config import get_settings
-from .graph_client import iter_remote_files
+from .graph_client import get_graph_client, iter_remote_files
 
 ReportType = Literal["actions", "crit_actions", "perms", "crit_perms"]
 
@@ -32,62 +35,106 @@ class FileRecord:
 
 _file_cache: TTLCache[ReportType, FileRecord] | None = None
 _settings = None
+# Lookups may run concurrently (threadpool routes, parallel readiness probes). cachetools
+# caches are not thread-safe, so every cache access holds ``_cache_lock`` briefly; misses
+# are serialised per report type so one discovery serves concurrent callers without
+# blocking lookups for other types behind a slow walk or download.
+_cache_lock = threading.Lock()
+_discovery_locks: Dict[ReportType, threading.Lock] = {report_type: threading.Lock() for report_type in FILE_PATTERNS}
+# One folder walk refreshes every report type, so local misses are single-flight too.
+_listing_lock = threading.Lock()
 
 
 def _ensure_cache() -> None:
     global _file_cache, _settings
-    if _file_cache is None:
-        _settings = get_settings()
-        _file_cache = TTLCache(maxsize=16, ttl=_settings.file_index_ttl_seconds)
+    with _cache_lock:
+        if _file_cache is None:
+            _settings = get_settings()
+            _file_cache = TTLCache(maxsize=16, ttl=_settings.file_index_ttl_seconds)
 
 
 def clear_file_cache() -> None:
-    if _file_cache is not None:
-        _file_cache.clear()
+    with _cache_lock:
+        if _file_cache is not None:
+            _file_cache.clear()
 
 
-def _parse_timestamp(match: re.Match[str]) -> float:
-    date_part, time_part = match.groups()
-    return time.mktime(time.strptime(date_part + time_part, "%Y%m%d%H%M%S"))
-
-
-def _compute_file_hash(path: Path) -> str:
-    stat = path.stat()
-    return f"{path.name}:{stat.st_size}:{int(stat.st_mtime)}"
-
-
-def _discover_local_files(pattern: re.Pattern[str]) -> List[Tuple[Path, float]]:
-    settings = get_settings()
-    folder = settings.onedrive_local_path
-    if not folder:
-        return []
-    matches: List[Tuple[Path, float]] = []
-    for file in folder.iterdir():
-        if not file.is_file():
-            continue
-        match = pattern.match(file.name)
-        if match:
-            ts = _parse_timestamp(match)
-            matches.append((file, ts))
-    return matches
+def _parse_timestamp(match: re.Match[str]) -> str:
+    """Return the fixed-width ``YYYYMMDDHHMMSS`` stamp, which sorts lexicographically."""
 
-
-def _discover_remote_files(pattern: re.Pattern[str]) -> List[Tuple[Path, float]]:
-    names = []
+    date_part, time_part = match.groups()
+    return date_part + time_part
+
+
+def _timestamp_to_epoch(stamp: str) -> float:
+    return time.mktime(time.strptime(stamp, "%Y%m%d%H%M%S"))
+
+
+def _format_file_hash(name: str, size: int, mtime_ns: int) -> str:
+    return f"{name}:{size}:{mtime_ns // 1_000_000_000}"
+
+
+@lru_cache(maxsize=32)
+def _build_record(report_type: ReportType, path: Path, stamp: str, size: int, mtime_ns: int) -> FileRecord:
+    """Build a record once per on-disk file version; TTL expiry then only costs one stat."""
+
+    return FileRecord(
+        report_type=report_type,
+        path=path,
+        timestamp=_timestamp_to_epoch(stamp),
+        file_hash=_format_file_hash(path.name, size, mtime_ns),
+    )
+
+
+def _walk_local_folder(folder: Path) -> Dict[ReportType, FileRecord]:
+    """Walk the local folder once and build the newest record for every report type."""
+
+    newest: Dict[ReportType, Tuple[Path, str]] = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            for report_type, pattern in FILE_PATTERNS.items():
+                match = pattern.match(entry.name)
+                if match:
+                    break
+            else:
+                continue
+            if not entry.is_file():
+                continue
+            stamp = _parse_timestamp(match)
+            current = newest.get(report_type)
+            if current is None or stamp > current[1]:
+                newest[report_type] = (Path(entry.path), stamp)
+    records: Dict[ReportType, FileRecord] = {}
+    for report_type, (path, stamp) in newest.items():
+        stat = path.stat()
+        records[report_type] = _build_record(report_type, path, stamp, stat.st_size, stat.st_mtime_ns)
+    return records
+
+
+def _discover_local_file(folder: Path, report_type: ReportType) -> Optional[FileRecord]:
+    """Refresh every report type's cached record from one walk of the local folder."""
+
+    with _listing_lock:
+        # A lookup for another report type may have walked the folder while we waited.
+        record = _cached_record(report_type)
+        if record is not None:
+            return record
+        records = _walk_local_folder(folder)
+        with _cache_lock:
+            assert _file_cache is not None
+            _file_cache.update(records)
+    return records.get(report_type)
+
+
+def _discover_remote_files(pattern: re.Pattern[str]) -> List[Tuple[Path, str]]:
     settings = get_settings()
-    folder = settings.onedrive_local_path
-    if folder:
+    if settings.onedrive_local_path:
         return []
-    client_files: Dict[str, Path] = {}
-    for report_type, regex in FILE_PATTERNS.items():
-        if regex is pattern:
-            names = [name for name in _list_all_remote_names() if regex.match(name)]
-            break
-    if not names:
+    listed = [file for file in get_graph_client().list_files() if pattern.match(file.name)]
+    if not listed:
         return []
-    client_files = iter_remote_files(names)
-    results: List[Tuple[Path, float]] = []
-    for name, path in client_files.items():
+    results: List[Tuple[Path, str]] = []
+    for name, path in iter_remote_files(listed).items():
         match = pattern.match(name)
         if not match:
             continue
@@ -95,62 +142,46 @@ def _discover_remote_files(pattern: re.Pattern[str]) -> List[Tuple[Path, float]]
         results.append((path, ts))
     return results
 
-_remote_names_cache: Optional[List[str]] = None
-_remote_names_timestamp: float = 0.0
-
-
-def _list_all_remote_names() -> List[str]:
-    global _remote_names_cache, _remote_names_timestamp
-    settings = get_settings()
-    if settings.onedrive_local_path:
-        return []
-    now = time.time()
-    if _remote_names_cache and (now - _remote_names_timestamp) < settings.graph_cache_ttl_seconds:
-        return _remote_names_cache
-    from .graph_client import GraphClient
-
-    client = GraphClient()
-    files = client.list_files()
-    _remote_names_cache = [file.name for file in files]
-    _remote_names_timestamp = now
-    return _remote_names_cache
-
 
 def _discover_files(report_type: ReportType) -> Optional[FileRecord]:
     _ensure_cache()
-    pattern = FILE_PATTERNS[report_type]
-    matches = _discover_local_files(pattern)
-    if not matches:
-        matches = _discover_remote_files(pattern)
+    folder = get_settings().onedrive_local_path
+    if folder:
+        return _discover_local_file(folder, report_type)
+    matches = _discover_remote_files(FILE_PATTERNS[report_type])
     if not matches:
         return None
     matches.sort(key=lambda item: item[1], reverse=True)
-    path, ts = matches[0]
-    file_hash = _compute_file_hash(path)
-    return FileRecord(report_type=report_type, path=path, timestamp=ts, file_hash=file_hash)
+    path, stamp = matches[0]
+    stat = path.stat()
+    return _build_record(report_type, path, stamp, stat.st_size, stat.st_mtime_ns)
 
 
 def get_latest_file(report_type: ReportType) -> Path:
     """Return the latest file path for the given report type."""
 
+    return get_latest_file_with_hash(report_type).path
+
+
+def _cached_record(report_type: ReportType) -> Optional[FileRecord]:
     _ensure_cache()
     assert _file_cache is not None
-    record = _file_cache.get(report_type)
-    if record is None:
-        record = _discover_files(report_type)
-        if record is None:
-            raise FileNotFoundError(f"No files found for report type {report_type}")
-        _file_cache[report_type] = record
-    return record.path
+    with _cache_lock:
+        return _file_cache.get(report_type)
 
 
 def get_latest_file_with_hash(report_type: ReportType) -> FileRecord:
-    _ensure_cache()
-    assert _file_cache is not None
-    record = _file_cache.get(report_type)
-    if record is None:
-        record = _discover_files(report_type)
+    record = _cached_record(report_type)
+    if record is not None:
+        return record
+    with _discovery_locks[report_type]:
+        # Another caller may have finished the same discovery while we waited.
+        record = _cached_record(report_type)
         if record is None:
-            raise FileNotFoundError(f"No files found for report type {report_type}")
-        _file_cache[report_type] = record
+            record = _discover_files(report_type)
+            if record is None:
+                raise FileNotFoundError(f"No files found for report type {report_type}")
+            with _cache_lock:
+                assert _file_cache is not None
+                _file_cache[report_type] = record
     return record
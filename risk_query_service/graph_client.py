@@ -1,18 +1,26 @@
 """Minimal Microsoft Graph client for OneDrive file access."""
 from __future__ import annotations
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
 import requests
 from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
 
 from .config import get_settings
 
 GRAPH_SCOPE = "https://graph.microsoft.com/.default"
 TOKEN_URL_TEMPLATE = "https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Shared by every report type's discovery (readiness probes run them in parallel), so at most
+# DOWNLOAD_WORKERS downloads are in flight and the connection pool never overflows.
+_download_executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="graph-download")
 
 
 @dataclass
@@ -30,12 +38,25 @@ class GraphClient:
         self.settings = get_settings()
         self._token_cache: TTLCache[str, str] = TTLCache(maxsize=1, ttl=3500)
         self._listing_cache: TTLCache[str, List[GraphFile]] = TTLCache(maxsize=8, ttl=self.settings.graph_cache_ttl_seconds)
+        # The shared client is used from worker threads; the locks keep the caches consistent
+        # and let one request refresh the token or listing for all concurrent callers.
+        self._token_lock = threading.Lock()
+        self._listing_lock = threading.Lock()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=DOWNLOAD_WORKERS, pool_maxsize=2 * DOWNLOAD_WORKERS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def _get_token(self) -> str:
-        cached = self._token_cache.get("token")
-        if cached:
-            return cached
-
+        with self._token_lock:
+            cached = self._token_cache.get("token")
+            if cached:
+                return cached
+            token = self._fetch_token()
+            self._token_cache["token"] = token
+            return token
+
+    def _fetch_token(self) -> str:
         tenant = self.settings.ms_tenant_id
         client_id = self.settings.ms_client_id
         client_secret = self.settings.ms_client_secret
@@ -49,18 +70,21 @@ class GraphClient:
             "scope": GRAPH_SCOPE,
         }
         url = TOKEN_URL_TEMPLATE.format(tenant_id=tenant)
-        response = requests.post(url, data=data, timeout=10)
+        response = self._session.post(url, data=data, timeout=10)
         response.raise_for_status()
-        token = response.json()["access_token"]
-        self._token_cache["token"] = token
-        return token
+        return response.json()["access_token"]
 
     def list_files(self) -> List[GraphFile]:
         cache_key = "files"
-        cached = self._listing_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
+        with self._listing_lock:
+            cached = self._listing_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            files = self._fetch_listing()
+            self._listing_cache[cache_key] = files
+            return files
+
+    def _fetch_listing(self) -> List[GraphFile]:
         token = self._get_token()
         headers = {"Authorization": f"Bearer {token}"}
         folder_path = self.settings.ms_folder_path
@@ -73,7 +97,7 @@ class GraphClient:
         else:
             url = f"https://graph.microsoft.com/v1.0/me/drive/root:{folder_path}:/children"
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = self._session.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         values = response.json().get("value", [])
 
@@ -91,30 +115,62 @@ class GraphClient:
                     last_modified=item.get("lastModifiedDateTime", ""),
                 )
             )
-
-        self._listing_cache[cache_key] = files
         return files
 
-    def ensure_cached(self, filename: str) -> Path:
-        """Download the given file if not already cached locally."""
+    def download(self, file: GraphFile) -> Path:
+        """Download a listed file into the cache directory unless a fresh copy exists."""
+
+        cached = self._cached_path(file.name)
+        if cached is not None:
+            return cached
+
+        target = self.settings.cache_dir / file.name
+        partial = target.with_name(f"{target.name}.part")
+        try:
+            with self._session.get(file.download_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                with partial.open("wb") as handle:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        handle.write(chunk)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        partial.replace(target)
+        return target
 
+    def _cached_path(self, filename: str) -> Optional[Path]:
         cache_dir = self.settings.cache_dir
         cache_dir.mkdir(parents=True, exist_ok=True)
         target = cache_dir / filename
         if target.exists() and (time.time() - target.stat().st_mtime) < self.settings.graph_cache_ttl_seconds:
             return target
+        return None
 
-        files = self.list_files()
-        match = next((file for file in files if file.name == filename), None)
-        if not match:
-            raise FileNotFoundError(f"File {filename} not found in Microsoft Graph folder")
 
-        response = requests.get(match.download_url, timeout=30)
-        response.raise_for_status()
-        target.write_bytes(response.content)
-        return target
+_client: Optional[GraphClient] = None
+_client_lock = threading.Lock()
+
+
+def get_graph_client() -> GraphClient:
+    """Return a shared client so token and listing caches survive across calls.
+
+    The client is rebuilt whenever the settings instance changes (e.g. after a reset in tests).
+    """
+
+    global _client
+    settings = get_settings()
+    with _client_lock:
+        if _client is None or _client.settings is not settings:
+            _client = GraphClient()
+        return _client
+
 
+def iter_remote_files(files: Iterable[GraphFile]) -> Dict[str, Path]:
+    """Ensure the given listed files are cached locally, downloading them concurrently."""
 
-def iter_remote_files(names: Iterable[str]) -> Dict[str, Path]:
-    client = GraphClient()
-    return {name: client.ensure_cached(name) for name in names}
+    client = get_graph_client()
+    files = list(files)
+    if not files:
+        return {}
+    paths = list(_download_executor.map(client.download, files))
+    return {file.name: path for file, path in zip(files, paths)}
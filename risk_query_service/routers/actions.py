@@ -1,11 +1,13 @@
 """Risk action query endpoints."""
 from __future__ import annotations
 
+import asyncio
 import time
 from datetime import date
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from ..datasets import (
@@ -24,10 +26,12 @@ from ..utils.paginate import (
     maybe_decode_cursor,
     next_cursor,
 )
+from ..utils.responses import json_envelope_response
 
 router = APIRouter(prefix="/risk/actions", tags=["Risk Actions"], dependencies=[Depends(require_api_key)])
 
 
+# Response schema for OpenAPI only; handlers return the payload pre-rendered.
 class QueryResponse(BaseModel):
     data: List[Dict[str, Any]]
     cursor: Optional[str] = None
@@ -72,7 +76,7 @@ def _prepare_columns(columns: Optional[str]) -> Optional[List[str]]:
 
 
 @router.get("/query", response_model=QueryResponse)
-def query_actions(
+async def query_actions(
     *,
     user: Optional[str] = Query(None, description="Filter by user (substring match)"),
     role: Optional[str] = Query(None, description="Filter by role ID"),
@@ -85,8 +89,8 @@ def query_actions(
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
     cursor: Optional[str] = Query(None, description="Opaque cursor token"),
     offset: int = Query(0, ge=0, description="Offset (ignored when cursor is provided)"),
-) -> QueryResponse:
-    bundle = actions_bundle()
+) -> Response:
+    bundle = await asyncio.to_thread(actions_bundle)
     parsed_from = _parse_date(date_from)
     parsed_to = _parse_date(date_to)
 
@@ -115,12 +119,12 @@ def query_actions(
     lf = select_columns(lf, _prepare_columns(columns))
 
     start = time.perf_counter()
-    rows, has_more = paginate_collect(lf, limit, effective_offset)
+    data, rows_returned, has_more = await asyncio.to_thread(paginate_collect, lf, limit, effective_offset)
     duration = time.perf_counter() - start
     partial = duration > 3.0
 
     if has_more:
-        next_cur = next_cursor(cursor_obj, len(rows))
+        next_cur = next_cursor(cursor_obj, rows_returned)
         cursor_token = encode_cursor(next_cur)
     else:
         cursor_token = None
@@ -136,14 +140,14 @@ def query_actions(
             "date_from": date_from,
             "date_to": date_to,
         },
-        rows_returned=len(rows),
+        rows_returned=rows_returned,
         has_more=has_more,
         partial=partial,
         latency_ms=int(duration * 1000),
     )
 
-    return QueryResponse(
-        data=rows,
+    return json_envelope_response(
+        data,
         cursor=cursor_token,
         has_more=has_more,
         partial=partial,
@@ -153,7 +157,7 @@ def query_actions(
 
 
 @router.get("/summary", response_model=SummaryResponse)
-def summary_actions(
+async def summary_actions(
     *,
     groupby: str = Query(..., description="Column to group by"),
     top: int = Query(20, ge=1, le=100),
@@ -164,12 +168,12 @@ def summary_actions(
     action: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
-) -> SummaryResponse:
+) -> Response:
     canonical_group = groupby.strip()
     if canonical_group not in SUMMARY_GROUPS:
         raise HTTPException(status_code=400, detail="Unsupported groupby column")
 
-    bundle = actions_bundle()
+    bundle = await asyncio.to_thread(actions_bundle)
     parsed_from = _parse_date(date_from)
     parsed_to = _parse_date(date_to)
     lf = apply_filters(
@@ -182,7 +186,7 @@ def summary_actions(
         date_from=parsed_from,
         date_to=parsed_to,
     )
-    records = summarize(lf, canonical_group, top)
+    data, groups_returned = await asyncio.to_thread(summarize, lf, canonical_group, top)
 
     log_request_summary(
         "/risk/actions/summary",
@@ -194,7 +198,7 @@ def summary_actions(
             "system": system,
             "action": action,
         },
-        rows_returned=len(records),
+        rows_returned=groups_returned,
     )
 
-    return SummaryResponse(data=records, report_type=bundle.report_type)
+    return json_envelope_response(data, report_type=bundle.report_type)
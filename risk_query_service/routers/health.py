@@ -1,23 +1,30 @@
 """Health check endpoints."""
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from ..file_index import FILE_PATTERNS, get_latest_file
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
-@router.get("/live")
-def live() -> dict[str, str]:
-    return {"status": "ok"}
+@router.get("/live", response_model=dict[str, str])
+def live() -> ORJSONResponse:
+    return ORJSONResponse({"status": "ok"})
 
 
-@router.get("/ready")
-def ready() -> dict[str, str]:
-    for report_type in FILE_PATTERNS:
-        try:
-            get_latest_file(report_type)
-        except FileNotFoundError as exc:
-            raise HTTPException(status_code=503, detail=str(exc)) from exc
-    return {"status": "ok"}
+@router.get("/ready", response_model=dict[str, str])
+async def ready() -> ORJSONResponse:
+    results = await asyncio.gather(
+        *(asyncio.to_thread(get_latest_file, report_type) for report_type in FILE_PATTERNS),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, FileNotFoundError):
+            raise HTTPException(status_code=503, detail=str(result)) from result
+        if isinstance(result, BaseException):
+            raise result
+    return ORJSONResponse({"status": "ok"})
@@ -1,47 +1,53 @@
 """Metadata endpoints for schema and facets."""
 from __future__ import annotations
 
+import asyncio
+import threading
 from typing import Dict, List
 
 import polars as pl
+from cachetools import LRUCache
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from ..datasets import actions_bundle, infer_schema, permissions_bundle
-from ..utils.schema import CANONICAL_COLUMNS
+from ..utils.schema import canonicalize_columns
 
 router = APIRouter(prefix="/meta", tags=["Metadata"])
 
 
 def _resolve_column(column: str) -> str:
-    mapping = {name.lower(): name for name in CANONICAL_COLUMNS}
-    key = column.lower()
-    if key not in mapping:
-        raise HTTPException(status_code=400, detail=f"Unknown column '{column}'")
-    return mapping[key]
+    try:
+        return canonicalize_columns([column])[0]
+    except KeyError as exc:
+        raise HTTPException(status_code=400, detail=f"Unknown column '{column}'") from exc
 
 
-schema_cache: dict[tuple[str, str], Dict[str, str]] = {}
+schema_cache: LRUCache[tuple[str, str], Dict[str, str]] = LRUCache(maxsize=8)
+# _load_schema runs on worker threads and LRUCache reorders itself on every read.
+_schema_cache_lock = threading.Lock()
 
 
-@router.get("/schema")
-def get_schema() -> Dict[str, str]:
+def _load_schema() -> Dict[str, str]:
     actions = actions_bundle()
     permissions = permissions_bundle()
     key = (actions.file_hash, permissions.file_hash)
-    if key not in schema_cache:
-        combined = pl.concat([actions.lazyframe, permissions.lazyframe], how="diagonal_relaxed")
-        schema_cache[key] = infer_schema(combined)
-    return schema_cache[key]
+    with _schema_cache_lock:
+        schema = schema_cache.get(key)
+    if schema is None:
+        schema = infer_schema(actions.lazyframe)
+        schema.update(infer_schema(permissions.lazyframe))
+        with _schema_cache_lock:
+            schema_cache[key] = schema
+    return schema
 
 
-@router.get("/facets")
-def get_facets(column: str = Query(..., description="Column name"), n: int = Query(20, ge=1, le=100)) -> List[Dict[str, object]]:
-    canonical = _resolve_column(column)
+def _count_facets(column: str, n: int) -> List[Dict[str, object]]:
     actions = actions_bundle()
     permissions = permissions_bundle()
     combined = pl.concat([actions.lazyframe, permissions.lazyframe], how="vertical")
     result = (
-        combined.group_by(canonical)
+        combined.group_by(column)
         .agg(pl.len().alias("count"))
         .sort("count", descending=True)
         .limit(n)
@@ -49,5 +55,18 @@ def get_facets(column: str = Query(..., description="Column name"), n: int = Que
     )
     facets: List[Dict[str, object]] = []
     for row in result.iter_rows(named=True):
-        facets.append({"value": row[canonical], "count": row["count"]})
+        facets.append({"value": row[column], "count": row["count"]})
     return facets
+
+
+@router.get("/schema", response_model=Dict[str, str])
+async def get_schema() -> ORJSONResponse:
+    return ORJSONResponse(await asyncio.to_thread(_load_schema))
+
+
+@router.get("/facets", response_model=List[Dict[str, object]])
+async def get_facets(
+    column: str = Query(..., description="Column name"), n: int = Query(20, ge=1, le=100)
+) -> ORJSONResponse:
+    canonical = _resolve_column(column)
+    return ORJSONResponse(await asyncio.to_thread(_count_facets, canonical, n))
@@ -1,11 +1,13 @@
 """Risk permission query endpoints."""
 from __future__ import annotations
 
+import asyncio
 import time
 from datetime import date
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from ..datasets import (
@@ -18,10 +20,12 @@ from ..datasets import (
 from ..security import require_api_key
 from ..utils.logging import log_request_summary
 from ..utils.paginate import build_initial_cursor, encode_cursor, maybe_decode_cursor, next_cursor
+from ..utils.responses import json_envelope_response
 
 router = APIRouter(prefix="/risk/permissions", tags=["Risk Permissions"], dependencies=[Depends(require_api_key)])
 
 
+# Response schema for OpenAPI only; handlers return the payload pre-rendered.
 class QueryResponse(BaseModel):
     data: List[Dict[str, Any]]
     cursor: Optional[str] = None
@@ -66,7 +70,7 @@ def _prepare_columns(columns: Optional[str]) -> Optional[List[str]]:
 
 
 @router.get("/query", response_model=QueryResponse)
-def query_permissions(
+async def query_permissions(
     *,
     user: Optional[str] = Query(None, description="Filter by user (substring match)"),
     role: Optional[str] = Query(None, description="Filter by role ID"),
@@ -79,8 +83,8 @@ def query_permissions(
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
     cursor: Optional[str] = Query(None, description="Opaque cursor token"),
     offset: int = Query(0, ge=0, description="Offset (ignored when cursor is provided)"),
-) -> QueryResponse:
-    bundle = permissions_bundle()
+) -> Response:
+    bundle = await asyncio.to_thread(permissions_bundle)
     parsed_from = _parse_date(date_from)
     parsed_to = _parse_date(date_to)
 
@@ -109,12 +113,12 @@ def query_permissions(
     lf = select_columns(lf, _prepare_columns(columns))
 
     start = time.perf_counter()
-    rows, has_more = paginate_collect(lf, limit, effective_offset)
+    data, rows_returned, has_more = await asyncio.to_thread(paginate_collect, lf, limit, effective_offset)
     duration = time.perf_counter() - start
     partial = duration > 3.0
 
     if has_more:
-        next_cur = next_cursor(cursor_obj, len(rows))
+        next_cur = next_cursor(cursor_obj, rows_returned)
         cursor_token = encode_cursor(next_cur)
     else:
         cursor_token = None
@@ -130,14 +134,14 @@ def query_permissions(
             "date_from": date_from,
             "date_to": date_to,
         },
-        rows_returned=len(rows),
+        rows_returned=rows_returned,
         has_more=has_more,
         partial=partial,
         latency_ms=int(duration * 1000),
     )
 
-    return QueryResponse(
-        data=rows,
+    return json_envelope_response(
+        data,
         cursor=cursor_token,
         has_more=has_more,
         partial=partial,
@@ -147,7 +151,7 @@ def query_permissions(
 
 
 @router.get("/summary", response_model=SummaryResponse)
-def summary_permissions(
+async def summary_permissions(
     *,
     groupby: str = Query(..., description="Column to group by"),
     top: int = Query(20, ge=1, le=100),
@@ -158,12 +162,12 @@ def summary_permissions(
     action: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
-) -> SummaryResponse:
+) -> Response:
     canonical_group = groupby.strip()
     if canonical_group not in SUMMARY_GROUPS:
         raise HTTPException(status_code=400, detail="Unsupported groupby column")
 
-    bundle = permissions_bundle()
+    bundle = await asyncio.to_thread(permissions_bundle)
     parsed_from = _parse_date(date_from)
     parsed_to = _parse_date(date_to)
     lf = apply_filters(
@@ -176,7 +180,7 @@ def summary_permissions(
         date_from=parsed_from,
         date_to=parsed_to,
     )
-    records = summarize(lf, canonical_group, top)
+    data, groups_returned = await asyncio.to_thread(summarize, lf, canonical_group, top)
 
     log_request_summary(
         "/risk/permissions/summary",
@@ -188,7 +192,7 @@ def summary_permissions(
             "system": system,
             "action": action,
         },
-        rows_returned=len(records),
+        rows_returned=groups_returned,
     )
 
-    return SummaryResponse(data=records, report_type=bundle.report_type)
+    return json_envelope_response(data, report_type=bundle.report_type)
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Generator
+from typing import Dict, Generator
 
 import pytest
 from fastapi.testclient import TestClient
 
 from ..config import reset_settings_cache
-from ..file_index import clear_file_cache
+from ..file_index import FILE_PATTERNS, FileRecord, clear_file_cache, get_latest_file_with_hash
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures"
 os.environ.setdefault("ONEDRIVE_LOCAL_PATH", str(FIXTURE_DIR))
@@ -16,21 +16,51 @@ os.environ.setdefault("API_KEY", "test-key")
 
 
 @pytest.fixture(scope="session")
-def client() -> Generator[TestClient, None, None]:
+def loaded_reports() -> Dict[str, FileRecord]:
+    """Resolve every fixture report once so the whole session shares a primed file index."""
+
+    from ..routers import meta
+
     reset_settings_cache()
     clear_file_cache()
+    meta.schema_cache.clear()
+    return {report_type: get_latest_file_with_hash(report_type) for report_type in FILE_PATTERNS}
+
+
+@pytest.fixture(scope="session")
+def client(loaded_reports: Dict[str, FileRecord]) -> Generator[TestClient, None, None]:
     from ..app import app
 
     with TestClient(app) as test_client:
+        # Warm the dataset plans and schema cache so the first test does not pay for them.
+        test_client.get("/meta/schema", headers={"x-api-key": os.environ["API_KEY"]}).raise_for_status()
         yield test_client
 
 
-@pytest.fixture(autouse=True)
-def _reset_caches() -> Generator[None, None, None]:
+@pytest.fixture(scope="session", autouse=True)
+def _warm_fixture_files() -> None:
+    """Ask the OS to page fixture reports in before Polars first scans them."""
+
+    with os.scandir(FIXTURE_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            with open(entry.path, "rb") as handle:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    handle.read(1)
+
+
+@pytest.fixture
+def reset_caches() -> Generator[None, None, None]:
+    """Clear settings, file and schema caches around tests that change the environment."""
+
     clear_file_cache()
     from ..routers import meta
 
     meta.schema_cache.clear()
     yield
+    reset_settings_cache()
     clear_file_cache()
     meta.schema_cache.clear()
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from ..config import _strip_quotes
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('"/data/NWBC files- UAR"', "/data/NWBC files- UAR"),
+        ("'/data/reports'", "/data/reports"),
+        ("  /data/reports  ", "/data/reports"),
+        ('"/data/reports', '"/data/reports'),
+        ("", ""),
+    ],
+)
+def test_strip_quotes(raw: str, expected: str) -> None:
+    assert _strip_quotes(raw) == expected
@@ -1,20 +1,66 @@
 from __future__ import annotations
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, List
+
+import pytest
 
 from .conftest import FIXTURE_DIR
 from ..config import reset_settings_cache
-from ..file_index import clear_file_cache, get_latest_file_with_hash
+from ..file_index import FILE_PATTERNS, get_latest_file_with_hash
+
+
+@pytest.fixture
+def count_walks(monkeypatch) -> Callable[..., List[str]]:
+    """Spy on folder walks in file_index; returns the list each walk is appended to."""
+
+    from .. import file_index
+
+    def install(delay: float = 0.0) -> List[str]:
+        real_scandir = os.scandir
+        walks: List[str] = []
+
+        def spy_scandir(path):
+            walks.append(path)
+            if delay:
+                time.sleep(delay)
+            return real_scandir(path)
+
+        monkeypatch.setattr(file_index.os, "scandir", spy_scandir)
+        return walks
+
+    return install
 
 
-def test_onedrive_local_path_with_quotes(monkeypatch) -> None:
+def test_onedrive_local_path_with_quotes(monkeypatch, reset_caches) -> None:
     quoted = f'"{FIXTURE_DIR}"'
     monkeypatch.setenv("ONEDRIVE_LOCAL_PATH", quoted)
     reset_settings_cache()
-    clear_file_cache()
 
     record = get_latest_file_with_hash("actions")
 
     assert record.path.parent == Path(FIXTURE_DIR)
 
-    reset_settings_cache()
+
+def test_cold_lookups_walk_folder_once(count_walks, reset_caches) -> None:
+    walks = count_walks(delay=0.05)
+
+    with ThreadPoolExecutor(max_workers=len(FILE_PATTERNS)) as executor:
+        records = list(executor.map(get_latest_file_with_hash, FILE_PATTERNS))
+
+    assert len(records) == len(FILE_PATTERNS)
+    assert len(walks) == 1
+
+
+def test_one_walk_refreshes_every_report_type(count_walks, reset_caches) -> None:
+    walks = count_walks()
+
+    actions = get_latest_file_with_hash("actions")
+    perms = get_latest_file_with_hash("perms")
+
+    assert actions.path.name == "RS_Action_Lvl_20240201_120000.txt"
+    assert perms.path.name == "RS_Perm_Lvl_20240201_140000.txt"
+    assert len(walks) == 1
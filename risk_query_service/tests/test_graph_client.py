@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ..config import reset_settings_cache
+from ..graph_client import GraphFile, get_graph_client
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _record(self, method: str) -> None:
+        with self._lock:
+            self.calls.append(method)
+        time.sleep(0.05)
+
+    def post(self, url: str, **kwargs) -> _FakeResponse:
+        self._record("POST")
+        return _FakeResponse({"access_token": "token"})
+
+    def get(self, url: str, **kwargs) -> _FakeResponse:
+        self._record("GET")
+        return _FakeResponse({"value": [{"name": "RS_Perm_Lvl_20240101_000000.txt", "@microsoft.graph.downloadUrl": "u"}]})
+
+
+def _configure_graph(monkeypatch, tmp_path) -> None:
+    for name, value in {
+        "MS_TENANT_ID": "tenant",
+        "MS_CLIENT_ID": "client",
+        "MS_CLIENT_SECRET": "secret",
+        "MS_FOLDER_PATH": "/reports",
+        "CACHE_DIR": str(tmp_path),
+    }.items():
+        monkeypatch.setenv(name, value)
+    reset_settings_cache()
+
+
+def test_concurrent_listing_fetches_once(monkeypatch, tmp_path, reset_caches) -> None:
+    _configure_graph(monkeypatch, tmp_path)
+    client = get_graph_client()
+    session = _FakeSession()
+    monkeypatch.setattr(client, "_session", session)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        listings = list(executor.map(lambda _: client.list_files(), range(4)))
+
+    assert sorted(session.calls) == ["GET", "POST"]
+    assert all(listing == listings[0] for listing in listings)
+
+
+def test_reset_settings_rebuilds_client(monkeypatch, tmp_path, reset_caches) -> None:
+    _configure_graph(monkeypatch, tmp_path)
+    first = get_graph_client()
+
+    monkeypatch.setenv("MS_FOLDER_PATH", "/other")
+    reset_settings_cache()
+
+    assert get_graph_client() is not first
+    assert get_graph_client().settings.ms_folder_path == "/other"
+
+
+def test_failed_download_removes_partial_file(monkeypatch, tmp_path, reset_caches) -> None:
+    _configure_graph(monkeypatch, tmp_path)
+    client = get_graph_client()
+
+    class _BrokenStream(_FakeResponse):
+        def __enter__(self) -> "_BrokenStream":
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            pass
+
+        def iter_content(self, chunk_size: int):
+            yield b"partial"
+            raise ConnectionError("stream interrupted")
+
+    monkeypatch.setattr(client._session, "get", lambda url, **kwargs: _BrokenStream({}))
+
+    with pytest.raises(ConnectionError):
+        client.download(GraphFile(name="report.txt", download_url="u", size=0, last_modified=""))
+
+    assert list(tmp_path.iterdir()) == []
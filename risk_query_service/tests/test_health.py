@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_live_endpoint(client: TestClient) -> None:
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_ready_endpoint(client: TestClient) -> None:
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_ready_endpoint_missing_report(client: TestClient, monkeypatch) -> None:
+    from ..routers import health
+
+    def missing(report_type: str):
+        raise FileNotFoundError(f"No files found for report type {report_type}")
+
+    monkeypatch.setattr(health, "get_latest_file", missing)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert "No files found" in response.json()["detail"]
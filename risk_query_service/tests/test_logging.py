@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import orjson
+from loguru import logger
+
+from ..utils.logging import configure_logging, log_request_summary
+
+
+def test_request_summary_is_written_as_json(monkeypatch, tmp_path) -> None:
+    log_file = tmp_path / "service.log"
+    monkeypatch.setenv("LOG_FILE", str(log_file))
+    try:
+        configure_logging()
+        log_request_summary("/risk/actions/query", rows=3)
+        logger.remove()
+    finally:
+        monkeypatch.delenv("LOG_FILE")
+        configure_logging()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    record = orjson.loads(lines[0])
+    assert record["endpoint"] == "/risk/actions/query"
+    assert record["event"] == "request-summary"
+    assert record["rows"] == 3
+    assert record["function"] == "test_request_summary_is_written_as_json"
+
+
+def test_exception_is_written_inside_the_json_line(monkeypatch, tmp_path) -> None:
+    log_file = tmp_path / "service.log"
+    monkeypatch.setenv("LOG_FILE", str(log_file))
+    try:
+        configure_logging()
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logger.exception("boom")
+        logger.remove()
+    finally:
+        monkeypatch.delenv("LOG_FILE")
+        configure_logging()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    records = [orjson.loads(line) for line in lines]
+    assert len(records) == 1
+    assert records[0]["message"] == "boom"
+    assert "ZeroDivisionError" in records[0]["exception"]
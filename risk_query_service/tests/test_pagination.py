@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import pytest
 from fastapi.testclient import TestClient
 
+from ..utils.paginate import Cursor, CursorError, decode_cursor, encode_cursor
+
 API_HEADERS = {"x-api-key": "test-key"}
 
 
@@ -27,3 +30,22 @@ def test_cursor_pagination(client: TestClient) -> None:
     payload2 = second.json()
     assert payload2["data"]
     assert payload2["data"][0]["User Name"] != first_name or payload2["has_more"] is False
+
+
+def test_cursor_round_trip() -> None:
+    cursor = Cursor(offset=150, file_hash="45856bb452c1137241643e0a026345252e45bd0a", report_type="actions")
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+def test_decode_cursor_rejects_garbage() -> None:
+    with pytest.raises(CursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_invalid_cursor_is_rejected(client: TestClient) -> None:
+    response = client.get(
+        "/risk/actions/query",
+        params={"limit": 1, "cursor": "not-a-cursor"},
+        headers=API_HEADERS,
+    )
+    assert response.status_code == 400
@@ -29,3 +29,37 @@ def test_permissions_query_user_search(client: TestClient) -> None:
     payload = response.json()
     assert payload["data"]
     assert payload["data"][0]["User Name"] == "Frank Hall"
+
+
+def test_user_search_is_literal(client: TestClient) -> None:
+    response = client.get(
+        "/risk/actions/query",
+        params={"user": ".*", "limit": 5},
+        headers=API_HEADERS,
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == []
+
+
+def test_actions_query_date_range(client: TestClient) -> None:
+    response = client.get(
+        "/risk/actions/query",
+        params={"date_from": "2024-01-08", "date_to": "2024-01-09", "limit": 50},
+        headers=API_HEADERS,
+    )
+    assert response.status_code == 200
+    dates = {row["Last Executed On"] for row in response.json()["data"]}
+    assert dates
+    assert dates <= {"2024-01-08", "2024-01-09"}
+
+
+def test_identifiers_keep_leading_zeros(tmp_path) -> None:
+    from ..datasets import _normalize_lazyframe, apply_filters, scan_report
+
+    report = tmp_path / "RS_Action_Lvl_20240101_000000.txt"
+    report.write_text("User ID\tUser Name\n007\tBond\n012\tOther\n")
+
+    lf = _normalize_lazyframe(scan_report(report), "actions", report)
+
+    assert lf.collect()["User ID"].to_list() == ["007", "012"]
+    assert apply_filters(lf, user="007").collect()["User Name"].to_list() == ["Bond"]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+API_HEADERS = {"x-api-key": "test-key"}
+
+
+def test_swagger2_endpoint(client: TestClient) -> None:
+    response = client.get("/swagger2.json", headers=API_HEADERS)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    payload = response.json()
+    assert payload["swagger"] == "2.0"
+    assert "/risk/actions/query" in payload["paths"]
+    assert payload["securityDefinitions"]["ApiKeyAuth"]["in"] == "header"
+
+
+def test_swagger2_leaves_openapi_untouched(client: TestClient) -> None:
+    client.get("/swagger2.json", headers=API_HEADERS)
+    openapi = client.get("/openapi.json").json()
+    responses = openapi["paths"]["/risk/actions/query"]["get"]["responses"]
+    assert "content" in responses["200"]
+    assert "schema" not in responses["200"]
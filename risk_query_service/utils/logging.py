@@ -1,35 +1,53 @@
 """Logging helpers using loguru."""
 from __future__ import annotations
 
-import json
 import os
+import sys
+import traceback
 from typing import Any, Dict
 
+import orjson
 from loguru import logger
 
 
+def _attach_json_line(record: Dict[str, Any]) -> None:
+    """Patcher that renders the record as a JSON line for the static sink format."""
+
+    payload = {
+        "timestamp": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "module": record["module"],
+        "function": record["function"],
+        "line": record["line"],
+    }
+    exception = record["exception"]
+    if exception is not None:
+        payload["exception"] = "".join(traceback.format_exception(exception.type, exception.value, exception.traceback))
+    payload.update(record["extra"])
+    record["extra"]["_json"] = orjson.dumps(payload, default=str).decode("utf-8")
+
+
+def _json_line_format(record: Dict[str, Any]) -> str:
+    """Static format; a callable stops loguru appending a plain-text traceback after the JSON."""
+
+    return "{extra[_json]}\n"
+
+
 def configure_logging() -> None:
     """Configure loguru to emit JSON lines suitable for production."""
 
     logger.remove()
+    logger.configure(patcher=_attach_json_line)
+    sink = os.environ.get("LOG_FILE") or sys.stderr
+    logger.add(sink, level="INFO", serialize=False, backtrace=False, diagnose=False, format=_json_line_format)
 
-    def _serialize(record: Dict[str, Any]) -> str:
-        payload = {
-            "timestamp": record["time"].isoformat(),
-            "level": record["level"].name,
-            "message": record["message"],
-            "module": record["module"],
-            "function": record["function"],
-            "line": record["line"],
-        }
-        payload.update(record.get("extra", {}))
-        return json.dumps(payload, default=str)
 
-    sink = os.environ.get("LOG_FILE") or "sys.stderr"
-    logger.add(sink, level="INFO", serialize=False, backtrace=False, diagnose=False, format=_serialize)
+# Bound once; depth=1 attributes records to the calling route rather than this helper.
+_REQUEST_LOGGER = logger.bind(event="request-summary").opt(depth=1)
 
 
 def log_request_summary(endpoint: str, **extra: Any) -> None:
     """Helper to log structured request summary."""
 
-    logger.bind(endpoint=endpoint, **extra).info("request-summary")
+    _REQUEST_LOGGER.info("request-summary", endpoint=endpoint, **extra)
@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 import base64
-import json
-from dataclasses import dataclass
-from typing import Optional
+import struct
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+# Token layout: file_hash length, report_type length, both UTF-8 strings, then the offset.
+# Everything before the offset is constant for a dataset, so it is cached per dataset.
+_HEADER = struct.Struct("<BB")
+_OFFSET = struct.Struct("<Q")
 
-@dataclass
-class Cursor:
+
+class Cursor(NamedTuple):
     offset: int
     file_hash: str
     report_type: str
@@ -18,22 +22,40 @@ class CursorError(ValueError):
     """Raised when the cursor token cannot be decoded."""
 
 
+@lru_cache(maxsize=64)
+def _cursor_prefix(file_hash: str, report_type: str) -> bytes:
+    hash_bytes = file_hash.encode("utf-8")
+    type_bytes = report_type.encode("utf-8")
+    return _HEADER.pack(len(hash_bytes), len(type_bytes)) + hash_bytes + type_bytes
+
+
 def encode_cursor(cursor: Cursor) -> str:
-    payload = json.dumps(cursor.__dict__, separators=(",", ":"))
-    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8")
+    packed = _cursor_prefix(cursor.file_hash, cursor.report_type) + _OFFSET.pack(cursor.offset)
+    return base64.urlsafe_b64encode(packed).rstrip(b"=").decode("ascii")
 
 
+@lru_cache(maxsize=1024)
 def decode_cursor(token: str) -> Cursor:
     try:
-        raw = base64.urlsafe_b64decode(token.encode("utf-8"))
-        data = json.loads(raw.decode("utf-8"))
-        return Cursor(offset=int(data["offset"]), file_hash=str(data["file_hash"]), report_type=str(data["report_type"]))
-    except Exception as exc:  # noqa: BLE001
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        hash_len, type_len = _HEADER.unpack_from(raw)
+        hash_end = _HEADER.size + hash_len
+        type_end = hash_end + type_len
+        if len(raw) != type_end + _OFFSET.size:
+            raise ValueError("Cursor length mismatch")
+        (offset,) = _OFFSET.unpack_from(raw, type_end)
+        return Cursor(
+            offset=offset,
+            file_hash=raw[_HEADER.size : hash_end].decode("utf-8"),
+            report_type=raw[hash_end:type_end].decode("utf-8"),
+        )
+    except (ValueError, struct.error) as exc:
+        # binascii.Error and UnicodeDecodeError are ValueErrors; struct.error covers short tokens.
         raise CursorError("Invalid cursor token") from exc
 
 
 def next_cursor(current: Cursor, advance: int) -> Cursor:
-    return Cursor(offset=current.offset + advance, file_hash=current.file_hash, report_type=current.report_type)
+    return current._replace(offset=current.offset + advance)
 
 
 def build_initial_cursor(file_hash: str, report_type: str, offset: int = 0) -> Cursor:
@@ -59,14 +59,20 @@ CANONICAL_TYPES: Dict[str, pl.DataType] = {
 }
 
 
+_CANON_SET = frozenset(CANONICAL_COLUMNS)
+_CANON_LOWER: Dict[str, str] = {name.lower(): name for name in CANONICAL_COLUMNS}
+
+
 def canonicalize_columns(columns: List[str]) -> List[str]:
     """Return canonical columns while preserving the requested order."""
 
-    canon = {name.lower(): name for name in CANONICAL_COLUMNS}
     resolved: List[str] = []
     for column in columns:
-        key = column.lower()
-        if key not in canon:
+        if column in _CANON_SET:
+            resolved.append(column)
+            continue
+        canonical = _CANON_LOWER.get(column.lower())
+        if canonical is None:
             raise KeyError(f"Unknown column: {column}")
-        resolved.append(canon[key])
+        resolved.append(canonical)
     return resolved
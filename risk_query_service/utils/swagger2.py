@@ -1,7 +1,13 @@
 """Convert OpenAPI 3.0 schemas to Swagger 2.0 at runtime."""
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+_CACHE_SIZE = 2
+# Keyed by id() of the input; the input itself is kept so the id cannot be reused.
+_CACHE: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+_DROPPED_OPERATION_KEYS = frozenset({"callbacks", "servers"})
+_PARAMETER_SCHEMA_KEYS = ("enum", "items", "format")
 
 
 class SwaggerConversionError(RuntimeError):
@@ -9,8 +15,23 @@ class SwaggerConversionError(RuntimeError):
 
 
 def convert_openapi3_to_swagger2(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
-    """Perform a minimal conversion from OpenAPI 3.0 to Swagger 2.0."""
+    """Perform a minimal conversion from OpenAPI 3.0 to Swagger 2.0.
+
+    Results are cached per input object, so the schema must not be mutated after conversion
+    and the returned document is shared between callers.
+    """
+
+    cached = _CACHE.get(id(openapi_schema))
+    if cached is not None and cached[0] is openapi_schema:
+        return cached[1]
+    swagger = _convert(openapi_schema)
+    if len(_CACHE) >= _CACHE_SIZE:
+        _CACHE.pop(next(iter(_CACHE)))
+    _CACHE[id(openapi_schema)] = (openapi_schema, swagger)
+    return swagger
+
 
+def _convert(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
     if "openapi" not in openapi_schema:
         raise SwaggerConversionError("Expected an OpenAPI 3.0 schema")
 
@@ -59,37 +80,34 @@ def convert_openapi3_to_swagger2(openapi_schema: Dict[str, Any]) -> Dict[str, An
     for path, methods in openapi_schema.get("paths", {}).items():
         swagger_methods: Dict[str, Any] = {}
         for method, operation in methods.items():
-            new_operation = dict(operation)
-            responses = new_operation.get("responses", {})
-            for status, response in list(responses.items()):
-                content = response.get("content")
-                if content:
-                    json_schema = content.get("application/json", {}).get("schema")
-                    if json_schema:
-                        response = dict(response)
-                        response["schema"] = json_schema
-                    response.pop("content", None)
-                    responses[status] = response
-            new_operation["responses"] = responses
-
-            parameters = []
-            for param in new_operation.get("parameters", []):
-                param = dict(param)
-                schema = param.pop("schema", None)
-                if schema is not None:
-                    param["type"] = schema.get("type")
-                    if schema.get("enum"):
-                        param["enum"] = schema["enum"]
-                    if schema.get("items"):
-                        param["items"] = schema["items"]
-                    if schema.get("format"):
-                        param["format"] = schema["format"]
-                parameters.append(param)
-            new_operation["parameters"] = parameters
-
-            new_operation.pop("callbacks", None)
-            new_operation.pop("servers", None)
+            new_operation = {key: value for key, value in operation.items() if key not in _DROPPED_OPERATION_KEYS}
+            new_operation["responses"] = {
+                status: _convert_response(response) for status, response in operation.get("responses", {}).items()
+            }
+            new_operation["parameters"] = [_convert_parameter(param) for param in operation.get("parameters", [])]
             swagger_methods[method] = new_operation
         swagger["paths"][path] = swagger_methods
 
     return swagger
+
+
+def _convert_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    content = response.get("content")
+    if not content:
+        return response
+    converted = {key: value for key, value in response.items() if key != "content"}
+    json_schema = content.get("application/json", {}).get("schema")
+    if json_schema:
+        converted["schema"] = json_schema
+    return converted
+
+
+def _convert_parameter(param: Dict[str, Any]) -> Dict[str, Any]:
+    converted = {key: value for key, value in param.items() if key != "schema"}
+    schema = param.get("schema")
+    if schema is not None:
+        converted["type"] = schema.get("type")
+        for key in _PARAMETER_SCHEMA_KEYS:
+            if schema.get(key):
+                converted[key] = schema[key]
+    return converted